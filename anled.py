@@ -6,20 +6,28 @@
 
 from __future__ import annotations
 
-import copy
+import array
+import bisect
+import codecs
+import collections
+import functools
+import itertools
 import os
 import pathlib
+import re
+import select
 import shutil
+import signal
 import subprocess
 import sys
 import textwrap
-from enum import Enum, auto
+import time
+from enum import IntEnum, auto
 from typing import List, Tuple
 
 try:
     import tty
     import termios
-    import fcntl
     IS_UNIX = True
 except ImportError:
     import msvcrt
@@ -34,10 +42,24 @@ def term_size() -> Tuple[int, int]:
 def clear_screen() -> None:
     print("\x1b[2J\x1b[H", end="")
 
-def wrap_line(line: str, width: int) -> List[str]:
+@functools.lru_cache(maxsize=4096)
+def _wrap_line_cached(line: str, width: int) -> Tuple[str, ...]:
     if line.endswith("\n"):
         line = line[:-1]
-    return textwrap.wrap(line, width=width, replace_whitespace=False) or [""]
+    if _is_plain_ascii(line):
+        step = max(1, width)
+        return tuple(line[i:i + step] for i in range(0, len(line), step)) or ("",)
+    cols = _visual_columns(line)
+    chunks = []
+    start = 0
+    while start < len(line):
+        end = max(start + 1, bisect.bisect_right(cols, cols[start] + width, start + 1) - 1)
+        chunks.append(line[start:end])
+        start = end
+    return tuple(chunks) or ("",)
+
+def wrap_line(line: str, width: int) -> List[str]:
+    return list(_wrap_line_cached(line, width))
 
 def get_clip_text_ps():
     return subprocess.check_output(
@@ -48,48 +70,69 @@ def set_clip_text_ps(text: str):
     p = subprocess.Popen(["clip"], stdin=subprocess.PIPE)
     p.communicate(input=text.encode("utf-8"))
 
+def _build_char_width_table():
+    table = bytearray(b'\x01') * (sys.maxunicode + 1)
+    for start, end, width in (
+        (0x0000, 0x001f, 0), (0x007f, 0x009f, 0),
+        (0x1100, 0x115f, 2), (0x2329, 0x232a, 2),
+        (0x2e80, 0xa4cf, 2), (0xac00, 0xd7a3, 2),
+        (0xf900, 0xfaff, 2), (0xfe30, 0xfe6f, 2),
+        (0xff00, 0xff60, 2), (0xffe0, 0xffe6, 2),
+    ):
+        table[start:end + 1] = bytes([width]) * (end - start + 1)
+    table[0x303f] = 1
+    return table
+
+_CHAR_WIDTH_TABLE = _build_char_width_table()
+_CHAR_WIDTH_TRANS = _CHAR_WIDTH_TABLE[:0x10000].decode('latin-1')
+
 def _get_char_width(c):
-    if c == '\0' or c < ' ' or (0x7f <= ord(c) <= 0x9f):
-        return 0
-    if 0x1100 <= ord(c) <= 0x115f or \
-       0x2329 <= ord(c) <= 0x232a or \
-       0x2e80 <= ord(c) <= 0xa4cf and ord(c) != 0x303f or \
-       0xac00 <= ord(c) <= 0xd7a3 or \
-       0xf900 <= ord(c) <= 0xfaff or \
-       0xfe30 <= ord(c) <= 0xfe6f or \
-       0xff00 <= ord(c) <= 0xff60 or \
-       0xffe0 <= ord(c) <= 0xffe6:
-        return 2
-    return 1
+    return _CHAR_WIDTH_TABLE[ord(c)]
 
-def visual_len(s):
-    return sum(_get_char_width(c) for c in s)
+def _char_widths(s):
+    return map(_CHAR_WIDTH_TABLE.__getitem__, map(ord, s))
 
-def visual_slice(s, start_col, end_col=None):
-    start_idx, current_col = 0, 0
-    for i, char in enumerate(s):
-        if current_col >= start_col:
-            start_idx = i
-            break
-        current_col += _get_char_width(char)
-    else:
-        start_idx = len(s)
+def _visual_columns(s):
+    return list(itertools.accumulate(_char_widths(s), initial=0))
 
+def _visual_bounds(s, start_col, end_col=None):
+    limit = max(start_col, end_col or 0, 0)
+    head = s[:limit]
+    cols = _visual_columns(head)
+    if len(head) < len(s) and cols[-1] < limit:
+        cols = _visual_columns(s)
+    start_idx = min(bisect.bisect_left(cols, start_col), len(s))
     if end_col is None:
-        return s[start_idx:]
-
-    end_idx = start_idx
-    current_col = visual_len(s[:start_idx])
-    for i, char in enumerate(s[start_idx:], start_idx):
-        if current_col >= end_col:
-            end_idx = i
-            break
-        current_col += _get_char_width(char)
-    else:
-        end_idx = len(s)
+        return start_idx, len(s)
+    return start_idx, min(bisect.bisect_left(cols, end_col, start_idx), len(s))
 
+def _is_plain_ascii(s):
+    return s.isascii() and s.isprintable()
+
+def visual_len(s):
+    if _is_plain_ascii(s):
+        return len(s)
+    widths = s.translate(_CHAR_WIDTH_TRANS)
+    return len(widths) - widths.count('\0') + widths.count('\2')
+
+def visual_slice(s, start_col, end_col=None):
+    if _is_plain_ascii(s):
+        return s[start_col:end_col]
+    start_idx, end_idx = _visual_bounds(s, start_col, end_col)
     return s[start_idx:end_idx]
 
+def visual_slice_with_highlight(s, start_col, end_col, sel_start, sel_end):
+    if _is_plain_ascii(s):
+        start_idx = max(0, min(start_col, len(s)))
+        end_idx = max(start_idx, min(end_col, len(s)))
+    else:
+        start_idx, end_idx = _visual_bounds(s, start_col, end_col)
+    sel_start = max(start_idx, min(sel_start, end_idx))
+    sel_end = max(sel_start, min(sel_end, end_idx))
+    if sel_start == sel_end:
+        return s[start_idx:end_idx]
+    return f"{s[start_idx:sel_start]}\x1b[7m{s[sel_start:sel_end]}\x1b[m{s[sel_end:end_idx]}"
+
 class FallbackEditor:
     APP_NAME = "ANLEd (Fallback)"
     APP_VERSION = _VERSION
@@ -115,6 +158,11 @@ class FallbackEditor:
     MENU_LINES = MENU_TEXT.count("\n") + 1
     FOOTER_LINES = MENU_LINES + 3
 
+    _NUM_PREFIX_CACHE: List[str] = []
+    _CONT_PREFIX = "      │ "
+    _SEL_OPEN = "\x1b[7m"
+    _SEL_CLOSE = "\x1b[0m"
+
     def __init__(self, filename: str | None = None, in_memory: bool = False):
         self.path = pathlib.Path(filename) if filename else None
         self.in_memory = in_memory
@@ -124,16 +172,42 @@ class FallbackEditor:
         self.running = False
         self.help_mode = False
 
-        cols, rows = term_size()
-        self.term_width = cols
-        self.view_height = max(1, rows - self.FOOTER_LINES)
         self.top = 0
         self.selector = 0
+        self._term_size: Tuple[int, int] | None = None
+        self._update_term_size()
+        self._update_filename_display()
+        self._footer_key: Tuple | None = None
+        self._footer = ""
+
+    def _update_term_size(self) -> None:
+        size = term_size()
+        if size == self._term_size:
+            return
+        self._term_size = size
+        cols, rows = size
+        self.term_width = cols
+        self.view_height = max(1, rows - self.FOOTER_LINES)
+        self._wrap = functools.partial(_wrap_line_cached, width=cols - 7)
+        self._rebuild_row_counts()
+
+    def _line_rows(self, line: str) -> int:
+        return len(self._wrap(line))
+
+    def _rebuild_row_counts(self) -> None:
+        self._row_counts = array.array('i', map(self._line_rows, self.lines))
+
+    def _update_filename_display(self) -> None:
+        if self.in_memory:
+            self._filename_display = '[In-Memory]'
+        else:
+            self._filename_display = str(self.path) if self.path else '[No Name]'
 
     def _load_file(self) -> List[str]:
-        if self.path and self.path.exists() and self.path.stat().st_size > 0:
-            return self.path.read_text(encoding="utf-8").splitlines(True)
-        return ["\n"]
+        try:
+            return self.path.read_text(encoding="utf-8").splitlines(True) or ["\n"]
+        except FileNotFoundError:
+            return ["\n"]
 
     def _save_file(self) -> None:
         if self.in_memory:
@@ -147,6 +221,7 @@ class FallbackEditor:
                     print("Save cancelled.")
                     return
                 self.path = pathlib.Path(filename)
+                self._update_filename_display()
             except (KeyboardInterrupt, EOFError):
                 print("\nSave cancelled.")
                 return
@@ -165,7 +240,13 @@ class FallbackEditor:
         content = "".join(self.lines)
         if not content.endswith('\n'):
             content += '\n'
-        tmp.write_text(content, encoding="utf-8")
+        data = memoryview(content.encode("utf-8"))
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
         tmp.replace(self.path)
         self.dirty = False
 
@@ -173,20 +254,25 @@ class FallbackEditor:
         if max_height <= 0:
             return ""
             
+        prefixes = self._NUM_PREFIX_CACHE
+        last_line = min(len(self.lines), self.top + max_height)
+        if len(prefixes) < last_line:
+            prefixes.extend(f"{n:>4} │ " for n in range(len(prefixes) + 1, last_line + 1))
+
         rendered: List[str] = []
         rows_used = 0
         i = self.top
         while i < len(self.lines) and rows_used < max_height:
-            wrapped = wrap_line(self.lines[i], self.term_width - 7)
+            wrapped = self._wrap(self.lines[i])
             for j, chunk in enumerate(wrapped):
                 if rows_used >= max_height:
                     break
 
-                prefix = f"{i+1:>4} │ " if j == 0 else "      │ "
+                prefix = prefixes[i] if j == 0 else self._CONT_PREFIX
                 full_line_content = prefix + chunk
 
                 if i == self.selector:
-                    rendered.append(f"\x1b[7m{full_line_content:<{self.term_width}}\x1b[0m")
+                    rendered.append(self._SEL_OPEN + full_line_content.ljust(self.term_width) + self._SEL_CLOSE)
                 else:
                     rendered.append(full_line_content)
 
@@ -195,10 +281,16 @@ class FallbackEditor:
         rendered.extend([""] * (max_height - rows_used))
         return "\n".join(rendered)
 
-    def _render_footer(self):
+    def _render_footer(self) -> str:
+        key = (self.selector, len(self.lines), self.dirty, self._filename_display, self.term_width)
+        if key != self._footer_key:
+            self._footer = self._build_footer()
+            self._footer_key = key
+        return self._footer
+
+    def _build_footer(self) -> str:
         dirty_indicator = "*" if self.dirty else ""
-        filename_display = '[In-Memory]' if self.in_memory else (str(self.path) or '[No Name]')
-        left_status = f"{self.APP_NAME} {self.APP_VERSION} - {filename_display}{dirty_indicator}"
+        left_status = f"{self.APP_NAME} {self.APP_VERSION} - {self._filename_display}{dirty_indicator}"
         
         right_status = f"Line {self.selector + 1}/{len(self.lines)}"
         
@@ -209,10 +301,11 @@ class FallbackEditor:
 
         status_bar_content = f"{left_status}{' ' * padding}{right_status}"
         
-        print(f"\x1b[7m{status_bar_content:<{self.term_width}}\x1b[0m")
-        
-        print("-" * self.term_width)
-        print(self.MENU_TEXT)
+        return (
+            f"\x1b[7m{status_bar_content:<{self.term_width}}\x1b[0m\n"
+            f"{'-' * self.term_width}\n"
+            f"{self.MENU_TEXT}\n"
+        )
 
     def _edit_line(self) -> None:
         k = self.selector
@@ -221,9 +314,11 @@ class FallbackEditor:
         if not new.endswith("\n"):
             new += "\n"
         self.lines[k] = new
+        self._row_counts[k] = self._line_rows(new)
 
     def _delete_line(self) -> None:
         del self.lines[self.selector]
+        del self._row_counts[self.selector]
         if self.selector >= len(self.lines):
             self.selector = max(0, len(self.lines) - 1)
 
@@ -232,6 +327,7 @@ class FallbackEditor:
         if not text.endswith("\n"):
             text += "\n"
         self.lines.insert(self.selector, text)
+        self._row_counts.insert(self.selector, self._line_rows(text))
 
     def _typewriter(self) -> None:
         idx = self.selector
@@ -272,6 +368,7 @@ class FallbackEditor:
                 self.lines[idx] = newline
             idx += 1
         self.selector = idx - 1
+        self._rebuild_row_counts()
 
     def run(self) -> str | None:
         self.running = True
@@ -279,8 +376,10 @@ class FallbackEditor:
         help_panel_height = len(help_text_lines)
 
         while self.running:
+            self._update_term_size()
             if not self.lines:
                 self.lines.append("\n")
+                self._rebuild_row_counts()
             self.selector = max(0, min(len(self.lines) - 1, self.selector))
 
             visible_height = self.view_height
@@ -290,15 +389,13 @@ class FallbackEditor:
             if self.selector < self.top:
                 self.top = self.selector
             else:
-                rows_used = 0
-                for i in range(self.top, self.selector + 1):
-                    rows_used += len(wrap_line(self.lines[i], self.term_width - 7))
+                rows_used = sum(self._row_counts[self.top:self.selector + 1])
 
                 if rows_used > visible_height:
                     new_top = self.selector
                     rows_to_fill = visible_height
                     while new_top >= 0:
-                        rows_for_line = len(wrap_line(self.lines[new_top], self.term_width - 7))
+                        rows_for_line = self._row_counts[new_top]
                         
                         if rows_for_line > rows_to_fill:
                             if new_top < self.selector:
@@ -311,20 +408,22 @@ class FallbackEditor:
                         new_top -= 1
                     self.top = new_top
                     
-            clear_screen()
+            frame = ["\x1b[2J\x1b[H"]
 
             if self.help_mode:
                 file_view_height = self.view_height - help_panel_height
                 file_view_str = self._render_window(max_height=file_view_height)
                 
                 if file_view_str:
-                    print(file_view_str)
-                print("─" * self.term_width)
-                print("\n".join(help_text_lines))
+                    frame.append(file_view_str + "\n")
+                frame.append("─" * self.term_width + "\n")
+                frame.append("\n".join(help_text_lines) + "\n")
             else:
-                print(self._render_window(max_height=self.view_height))
+                frame.append(self._render_window(max_height=self.view_height) + "\n")
             
-            self._render_footer()
+            frame.append(self._render_footer())
+            sys.stdout.write("".join(frame))
+            sys.stdout.flush()
 
             raw_cmd = input("> ")
             action = raw_cmd.strip()
@@ -357,7 +456,7 @@ class FallbackEditor:
                 self.help_mode = not self.help_mode
 
             elif action in {"e", "d", "a", "t"}:
-                self.undo.append(copy.deepcopy(self.lines))
+                self.undo.append(self.lines.copy())
                 self.dirty = True
 
                 if action == "e" and self.selector < len(self.lines): self._edit_line()
@@ -367,6 +466,7 @@ class FallbackEditor:
 
             elif action == "z" and self.undo:
                 self.lines[:] = self.undo.pop()
+                self._rebuild_row_counts()
                 self.dirty = True
 
         clear_screen()
@@ -374,7 +474,7 @@ class FallbackEditor:
             return "".join(self.lines)
         return None
 
-class Key(Enum):
+class Key(IntEnum):
     CTRL_A, CTRL_C, CTRL_D, CTRL_E, CTRL_F, CTRL_G, CTRL_H, CTRL_L, CTRL_N, CTRL_P, \
     CTRL_Q, CTRL_S, CTRL_V, CTRL_X, CTRL_Y, ENTER, ESCAPE, BACKSPACE, TAB = range(19)
     UP, DOWN, LEFT, RIGHT, HOME, END, DELETE, PAGE_UP, PAGE_DOWN, INSERT = range(19, 29)
@@ -391,6 +491,10 @@ class Key(Enum):
     CHAR = auto()
 
 class KeyDecoder:
+    _ESC_SEQ_RE = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]|\x1bO[A-Za-z]|\x1b[^\[O\x1b]|.', re.DOTALL)
+    _ESC_PARTIAL_RE = re.compile(r'\x1b(?:\[[0-?]*[ -/]*|O)?\Z')
+    ESC_SEQUENCE_TIMEOUT = 0.001
+
     def __init__(self):
         self.key_map = {
             '\x1b[A': Key.UP, '\x1b[B': Key.DOWN, '\x1b[C': Key.RIGHT, '\x1b[D': Key.LEFT,
@@ -411,7 +515,10 @@ class KeyDecoder:
             '\x1b[1;6H': Key.CTRL_SHIFT_HOME, '\x1b[1;6F': Key.CTRL_SHIFT_END,
             '\x1b[2;6~': Key.CTRL_SHIFT_INSERT, '\x1b[3;6~': Key.CTRL_SHIFT_DELETE,
         }
-        if not IS_UNIX:
+        self._pending = collections.deque()
+        if IS_UNIX:
+            self._utf8_decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        else:
             self._setup_windows_ctypes()
     def _setup_windows_ctypes(self):
         import ctypes
@@ -512,21 +619,39 @@ class KeyDecoder:
                 
                 return Key.UNKNOWN, None
 
-    def _get_key_unix(self):
-        char = sys.stdin.read(1)
-        if char != '\x1b': return self._map_single_char(char)
-        seq = char
+    def _read_pending(self):
         fd = sys.stdin.fileno()
-        old_flags = fcntl.fcntl(fd, fcntl.F_GETFL)
-        fcntl.fcntl(fd, fcntl.F_SETFL, old_flags | os.O_NONBLOCK)
-        try:
-            rest_of_seq = sys.stdin.read(5) 
-            if rest_of_seq: seq += rest_of_seq
-        except (BlockingIOError, InterruptedError): pass
-        finally:
-            fcntl.fcntl(fd, fcntl.F_SETFL, old_flags)
-        
-        if seq == '\x1b': return Key.ESCAPE, None
+        text = ''
+        while True:
+            data = os.read(fd, 4096)
+            text += self._utf8_decoder.decode(data)
+            if not data:
+                break
+            if not text:
+                continue
+            if not self._ESC_PARTIAL_RE.search(text):
+                break
+            if not select.select([fd], [], [], self.ESC_SEQUENCE_TIMEOUT)[0]:
+                break
+        for match in self._ESC_SEQ_RE.finditer(text):
+            self._pending.append(self._map_sequence(match.group()))
+        if not self._pending:
+            self._pending.append(self._map_single_char(''))
+
+    def has_pending(self):
+        if self._pending:
+            return True
+        if IS_UNIX:
+            return bool(select.select([sys.stdin.fileno()], [], [], 0)[0])
+        return msvcrt.kbhit()
+
+    def _get_key_unix(self):
+        if not self._pending:
+            self._read_pending()
+        return self._pending.popleft()
+
+    def _map_sequence(self, seq):
+        if len(seq) == 1: return self._map_single_char(seq)
         return self.key_map.get(seq, Key.UNKNOWN), None
         
     def _map_single_char(self, char):
@@ -547,22 +672,68 @@ class KeyDecoder:
 
 class GapBuffer:
     MIN_GAP_SIZE = 16
+    __slots__ = ('buffer', 'gap_start', 'gap_end', 'version', '_str_cache', '_char_count', '_anchor')
 
     def __init__(self, text=''):
-        encoded_text = text.encode('utf-8')
+        self.buffer = None
+        self.gap_start = self.gap_end = 0
+        self.version = 0
+        self._str_cache = text
+        self._char_count = len(text)
+        self._anchor = (0, 0)
+
+    def _materialize(self):
+        encoded_text = self._str_cache.encode('utf-8')
         initial_gap = max(self.MIN_GAP_SIZE, len(encoded_text) // 2)
         self.buffer = bytearray(len(encoded_text) + initial_gap)
         self.buffer[:len(encoded_text)] = encoded_text
         self.gap_start = len(encoded_text)
         self.gap_end = len(self.buffer)
+        self._anchor = (0, 0)
+
+    def compact(self):
+        if self.buffer is not None:
+            self._str_cache = self.as_str()
+            self.buffer = None
+
+    def _byte_len(self):
+        return len(self.buffer) - (self.gap_end - self.gap_start)
 
     def _get_byte_pos(self, char_pos):
-        return len(self.to_string()[:char_pos].encode('utf-8'))
+        char_pos = max(0, min(char_pos, self._char_count))
+        if self._byte_len() == self._char_count:
+            return char_pos
+        anchor_char, anchor_byte = self._anchor
+        if char_pos >= anchor_char:
+            steps = char_pos - anchor_char
+            span = self._byte_span(anchor_byte, min(anchor_byte + 4 * steps, self._byte_len()))
+            head = codecs.utf_8_decode(span, 'strict', False)[0]
+            byte_pos = anchor_byte + len(head[:steps].encode('utf-8'))
+        else:
+            steps = anchor_char - char_pos
+            span = self._byte_span(max(0, anchor_byte - 4 * steps), anchor_byte)
+            skip = 0
+            while span[skip] & 0xC0 == 0x80:
+                skip += 1
+            tail = span[skip:].decode('utf-8')
+            byte_pos = anchor_byte - len(tail[len(tail) - steps:].encode('utf-8'))
+        self._anchor = (char_pos, byte_pos)
+        return byte_pos
+
+    def _byte_span(self, start, end):
+        gap_start, gap_end = self.gap_start, self.gap_end
+        if end <= gap_start:
+            return self.buffer[start:end]
+        shift = gap_end - gap_start
+        if start >= gap_start:
+            return self.buffer[start + shift:end + shift]
+        return self.buffer[start:gap_start] + self.buffer[gap_end:end + shift]
 
     def _resize_if_needed(self, text_len):
         if (self.gap_end - self.gap_start) < text_len:
-            new_gap_size = max(self.MIN_GAP_SIZE, text_len, len(self) // 2)
-            new_buffer_size = len(self) + new_gap_size
+            content_len = self._byte_len()
+            new_gap_size = max(self.MIN_GAP_SIZE, text_len, content_len // 2)
+            new_buffer_size = content_len + new_gap_size
             new_buffer = bytearray(new_buffer_size)
 
             new_buffer[:self.gap_start] = self.buffer[:self.gap_start]
@@ -595,38 +766,79 @@ class GapBuffer:
             self.gap_end += move_len
 
     def insert(self, text, char_pos):
+        if self.buffer is None:
+            self._materialize()
+        char_pos = max(0, min(char_pos, self._char_count))
         self._move_gap(char_pos)
         encoded_text = text.encode('utf-8')
         text_len = len(encoded_text)
         self._resize_if_needed(text_len)
         self.buffer[self.gap_start : self.gap_start + text_len] = encoded_text
         self.gap_start += text_len
+        self._str_cache = None
+        self._char_count += len(text)
+        self.version += 1
+        self._anchor = (char_pos + len(text), self.gap_start)
 
     def delete(self, char_pos, char_len=1):
+        char_len = min(char_len, self._char_count - char_pos)
         if char_len <= 0: return
+        if self.buffer is None:
+            self._materialize()
         start_byte_pos = self._get_byte_pos(char_pos)
         end_byte_pos = self._get_byte_pos(char_pos + char_len)
         
         self._move_gap(char_pos)
         self.gap_end += (end_byte_pos - start_byte_pos)
+        self._str_cache = None
+        self._char_count -= char_len
+        self.version += 1
 
     def get_slice(self, start_char=None, end_char=None):
-        return self.to_string()[start_char:end_char]
+        return self.as_str()[start_char:end_char]
+
+    def as_str(self):
+        if self._str_cache is None:
+            encoding = 'ascii' if self._byte_len() == self._char_count else 'utf-8'
+            with memoryview(self.buffer) as view:
+                self._str_cache = (str(view[:self.gap_start], encoding, 'replace')
+                                   + str(view[self.gap_end:], encoding, 'replace'))
+        return self._str_cache
 
     def to_string(self):
-        return (self.buffer[:self.gap_start] + self.buffer[self.gap_end:]).decode('utf-8', 'replace')
+        return self.as_str()
+
+    @property
+    def length(self):
+        return self._char_count
 
     def __len__(self):
-        return len(self.to_string())
+        return self._char_count
 
     def __str__(self):
-        return self.to_string()
+        return self.as_str()
 
 class Editor:
     APP_NAME = "ANLEd"
     APP_VERSION = _VERSION
     LINE_NUM_WIDTH = 7
 
+    _CLR_EOL = b'\x1b[K'
+    _HIDE = b'\x1b[?25l'
+    _SHOW = b'\x1b[?25h'
+    _INV = b'\x1b[7m'
+    _RST = b'\x1b[m'
+
+    _DEFAULT_STATUS = "HELP: Ctrl-S save | Ctrl-Q quit | F1/Ctrl-H help"
+    _NEXT_WORD_RE = re.compile(r'\S*\s*')
+
+    _EDITING_ACTIONS = frozenset({'delete_back', 'delete_forward', 'insert_newline', 'insert_char'})
+    _NO_CLAMP = object()
+
+    COALESCE_KEYS = 8
+    COALESCE_SECONDS = 0.004
+    SIZE_POLL_INTERVAL = 16
+
     HELP_TEXT = textwrap.dedent("""\
         ─────── ANLEd Help (v{version}) ───────
         F1/Ctrl-H: Toggle this help panel
@@ -679,9 +891,17 @@ class Editor:
         self.in_memory = in_memory
         self.buffer = [] 
         
-        if self.filename and os.path.exists(self.filename) and not self.in_memory:
-            with open(self.filename, encoding="utf-8") as f:
-                self.buffer = [GapBuffer(line.rstrip('\n')) for line in f]
+        if self.filename and not self.in_memory:
+            try:
+                data = pathlib.Path(self.filename).read_bytes().decode('utf-8')
+            except FileNotFoundError:
+                data = ''
+            if '\r' in data:
+                data = data.replace('\r\n', '\n').replace('\r', '\n')
+            lines = data.split('\n')
+            if lines[-1] == '':
+                lines.pop()
+            self.buffer = [GapBuffer(line) for line in lines]
         
         if not self.buffer:
             self.buffer.append(GapBuffer(''))
@@ -692,7 +912,7 @@ class Editor:
         self.col_offset = 0
         self.running = True
         self.is_dirty = False
-        self.status_message = "HELP: Ctrl-S save | Ctrl-Q quit | F1/Ctrl-H help"
+        self.status_message = self._DEFAULT_STATUS
         self.help_mode = False
 
         self.selection_start_x = -1
@@ -700,12 +920,32 @@ class Editor:
         self.is_selecting = False
         self.clipboard = ""
         self.key_decoder = KeyDecoder()
+        self._hot_line = None
+        self._visual_cache = {}
+        self._out = bytearray()
+        self._state_version = 0
+        self._last_rendered_version = -1
+        self._cached_size = None
+        self._size_polls = 0
+        self._has_winch = False
+        self._help_cache = {}
+        self._cursor_visual_cache = None
+        self._row_anchors = []
+        self._stdout_fd = None
+        self._invalidate_screen()
 
         self.key_bindings = self.DEFAULT_KEY_BINDINGS.copy()
         if key_bindings:
             self.key_bindings.update(key_bindings)
 
-        self.action_map = {k: action for action, keys in self.key_bindings.items() for k in keys}
+        self.action_map = [None] * (max(Key) + 1)
+        for action, keys in self.key_bindings.items():
+            for k in keys:
+                self.action_map[k] = action
+        self._action_handlers = {
+            action: handler for action in self.key_bindings
+            if (handler := getattr(self, f'_h_{action}', None))
+        }
 
         movement_actions = {
             'move_up', 'move_down', 'move_left', 'move_right', 'move_home', 'move_end',
@@ -723,28 +963,68 @@ class Editor:
             if 'SHIFT' in k.name
         }
 
+    def _invalidate_screen(self):
+        self._prev_geometry = None
+        self._prev_rendered_lines = []
+        self._prev_status = None
+        self._prev_help_bar = None
+
     def get_terminal_size(self):
-        try:
-            sz = os.get_terminal_size()
-            return sz.columns, sz.lines
-        except OSError:
-            return 80, 24
+        if self._cached_size is None:
+            try:
+                sz = os.get_terminal_size()
+                self._cached_size = (sz.columns, sz.lines)
+            except OSError:
+                self._cached_size = (80, 24)
+        return self._cached_size
+
+    def _poll_terminal_size(self):
+        self._size_polls += 1
+        if self._size_polls >= self.SIZE_POLL_INTERVAL:
+            self._size_polls = 0
+            old_size = self._cached_size
+            self._cached_size = None
+            if self.get_terminal_size() != old_size:
+                self._state_version += 1
+
+    def _on_resize(self, signum, frame):
+        self._cached_size = None
+        self._state_version += 1
 
     def cursor_char_pos_to_visual(self, y, x):
-        return visual_len(str(self.buffer[y])[:x])
+        return visual_len(self.buffer[y].as_str()[:x])
+
+    def _visual_cursor_x(self):
+        y, x = self.cursor_y, self.cursor_x
+        line_gb = self.buffer[y]
+        key = (y, line_gb, line_gb.version)
+        last = self._cursor_visual_cache
+        if last is not None and last[0] == key:
+            last_x, visual_x = last[1], last[2]
+            if x == last_x:
+                return visual_x
+            if x == last_x + 1:
+                visual_x += _get_char_width(line_gb.as_str()[last_x])
+            elif x == last_x - 1:
+                visual_x -= _get_char_width(line_gb.as_str()[x])
+            else:
+                visual_x = self.cursor_char_pos_to_visual(y, x)
+        else:
+            visual_x = self.cursor_char_pos_to_visual(y, x)
+        self._cursor_visual_cache = (key, x, visual_x)
+        return visual_x
 
     def cursor_visual_pos_to_char(self, y, visual_x):
-        line = str(self.buffer[y])
-        current_col = 0
-        for i, char in enumerate(line):
-            if current_col >= visual_x:
-                return i
-            current_col += _get_char_width(char)
-        return len(line)
+        return _visual_bounds(self.buffer[y].as_str(), visual_x)[0]
 
     def clamp_cursor(self):
         self.cursor_y = max(0, min(self.cursor_y, len(self.buffer) - 1))
-        self.cursor_x = max(0, min(self.cursor_x, len(str(self.buffer[self.cursor_y]))))
+        self.cursor_x = max(0, min(self.cursor_x, self.buffer[self.cursor_y].length))
+        line = self.buffer[self.cursor_y]
+        if line is not self._hot_line:
+            if self._hot_line is not None:
+                self._hot_line.compact()
+            self._hot_line = line
 
     def prompt(self, prompt_msg):
         user_input = ""
@@ -766,28 +1046,32 @@ class Editor:
     def get_selection(self):
         if not self.is_selecting or self.selection_start_y == -1:
             return None
-        start_y, end_y = sorted([self.selection_start_y, self.cursor_y])
-        if self.selection_start_y == self.cursor_y:
-            start_x, end_x = sorted([self.selection_start_x, self.cursor_x])
-        elif self.selection_start_y < self.cursor_y:
-            start_x, end_x = self.selection_start_x, self.cursor_x
-        else:
-            start_x, end_x = self.cursor_x, self.selection_start_x
-        return start_y, start_x, end_y, end_x
+        sel_y, sel_x, cur_y, cur_x = self.selection_start_y, self.selection_start_x, self.cursor_y, self.cursor_x
+        if sel_y < cur_y or (sel_y == cur_y and sel_x <= cur_x):
+            return sel_y, sel_x, cur_y, cur_x
+        return cur_y, cur_x, sel_y, sel_x
         
     def render(self):
-        sys.stdout.write('\x1b[?25l')
-
         width, height = self.get_terminal_size()
         
         help_panel_height = 0
-        help_text_lines = []
+        help_lines = ()
         if self.help_mode:
-            help_text_lines = self.HELP_TEXT.strip().split('\n')
-            help_panel_height = len(help_text_lines) + 1
+            cached_help = self._help_cache.get(width)
+            if cached_help is None:
+                cached_help = self._help_cache[width] = (
+                    ("─" * width).encode('utf-8'),
+                    [line.ljust(width).encode('utf-8') for line in self.HELP_TEXT.strip().split('\n')])
+            help_separator, help_lines = cached_help
+            help_panel_height = len(help_lines) + 1
 
         view_height = height - 2 - help_panel_height
         if view_height < 1: view_height = 1
+
+        anchor_count = max(height, view_height + 1) + 1
+        if len(self._row_anchors) != anchor_count:
+            self._row_anchors = [f'\x1b[{y};1H'.encode('ascii') for y in range(anchor_count)]
+        anchors = self._row_anchors
         
         text_area_width = width - self.LINE_NUM_WIDTH
 
@@ -796,91 +1080,133 @@ class Editor:
         if self.cursor_y >= self.top_line + view_height:
             self.top_line = self.cursor_y - view_height + 1
 
-        visual_cursor_x = self.cursor_char_pos_to_visual(self.cursor_y, self.cursor_x)
+        visual_cursor_x = self._visual_cursor_x()
         if visual_cursor_x < self.col_offset:
             self.col_offset = visual_cursor_x
         if visual_cursor_x >= self.col_offset + text_area_width:
             self.col_offset = visual_cursor_x - text_area_width + 1
 
-        output_buffer = []
+        self._last_rendered_version = self._state_version
+        out = self._out
+        del out[:]
+        out += self._HIDE
         selection = self.get_selection()
+        frame_sel_map = {}
+        if selection:
+            start_y, start_x, end_y, end_x = selection
+            last_row = min(end_y, self.top_line + view_height - 1, len(self.buffer) - 1)
+            for row in range(max(start_y, self.top_line), last_row + 1):
+                frame_sel_map[row] = (start_x if row == start_y else 0,
+                                      end_x if row == end_y else self.buffer[row].length)
+
+        geometry = (width, height, self.help_mode)
+        full_redraw = geometry != self._prev_geometry
+        if full_redraw:
+            self._prev_geometry = geometry
+            self._prev_rendered_lines = [None] * view_height
+            self._prev_status = None
+            self._prev_help_bar = None
+        prev_lines = self._prev_rendered_lines
 
         for i in range(view_height):
-            output_buffer.append(f'\x1b[{i + 1};1H')
-            
             buf_idx = self.top_line + i
             if buf_idx < len(self.buffer):
                 line_gb = self.buffer[buf_idx]
-                line_str_raw = str(line_gb)
-                
-                line_num_prefix = f"{buf_idx + 1:>{self.LINE_NUM_WIDTH - 3}} | "
-                
-                if selection:
-                    start_y, start_x, end_y, end_x = selection
-                    if start_y <= buf_idx <= end_y:
-                        sel_start_char = start_x if buf_idx == start_y else 0
-                        sel_end_char = end_x if buf_idx == end_y else len(line_str_raw)
-                        part1 = line_str_raw[:sel_start_char]
-                        part2 = line_str_raw[sel_start_char:sel_end_char]
-                        part3 = line_str_raw[sel_end_char:]
-                        line_str_formatted = f"{part1}\x1b[7m{part2}\x1b[m{part3}"
-                    else:
-                        line_str_formatted = line_str_raw
+
+                sel_for_line = frame_sel_map.get(buf_idx)
+                key = (buf_idx, line_gb, line_gb.version, self.col_offset, text_area_width, sel_for_line)
+                cached = self._visual_cache.get(i)
+                if cached is not None and cached[0] == key:
+                    composed = cached[1]
                 else:
-                    line_str_formatted = line_str_raw
+                    line_str_raw = line_gb.as_str()
+                    line_num_prefix = f"{buf_idx + 1:>{self.LINE_NUM_WIDTH - 3}} | "
 
-                line_to_render = visual_slice(line_str_formatted, self.col_offset, self.col_offset + text_area_width)
-                full_line = f"{line_num_prefix}{line_to_render}"
-                output_buffer.append(full_line)
+                    if sel_for_line:
+                        line_to_render = visual_slice_with_highlight(
+                            line_str_raw, self.col_offset, self.col_offset + text_area_width, *sel_for_line)
+                    else:
+                        line_to_render = visual_slice(line_str_raw, self.col_offset, self.col_offset + text_area_width)
+                    composed = f"{line_num_prefix}{line_to_render}".encode('utf-8')
+                    self._visual_cache[i] = (key, composed)
             else:
-                tilde_prefix = " " * (self.LINE_NUM_WIDTH - 2) + "~ "
-                output_buffer.append(tilde_prefix)
-            
-            output_buffer.append('\x1b[K')
+                composed = b" " * (self.LINE_NUM_WIDTH - 2) + b"~ "
 
-        for i in range(view_height, height - 2):
-            output_buffer.append(f'\x1b[{i + 1};1H\x1b[K')
+            if composed != prev_lines[i]:
+                prev_lines[i] = composed
+                out += anchors[i + 1]
+                out += composed
+                out += self._CLR_EOL
 
-        if self.help_mode:
+        if full_redraw:
+            for i in range(view_height, height - 2):
+                out += anchors[i + 1]
+                out += self._CLR_EOL
+
+        if self.help_mode and full_redraw:
             separator_y = view_height + 1
-            output_buffer.append(f'\x1b[{separator_y};1H')
-            output_buffer.append("─" * width)
+            out += anchors[separator_y]
+            out += help_separator
 
-            for i, line in enumerate(help_text_lines):
+            for i, line in enumerate(help_lines):
                 help_line_y = separator_y + 1 + i
                 if help_line_y < height - 1:
-                    output_buffer.append(f'\x1b[{help_line_y};1H')
-                    output_buffer.append(line.ljust(width))
+                    out += anchors[help_line_y]
+                    out += line
         
         dirty_indicator = "*" if self.is_dirty else ""
         filename_display = '[In-Memory]' if self.in_memory else (self.filename or '[No Name]')
         left_status = f"{self.APP_NAME} {self.APP_VERSION} - {filename_display}{dirty_indicator}"
         right_status = f"Ln {self.cursor_y + 1}, Col {visual_cursor_x + 1}"
-        
-        status_bar_content = f"{left_status.ljust(width - len(right_status))}{right_status}"
-        output_buffer.append(f"\x1b[{height-1};1H\x1b[7m{status_bar_content}\x1b[m")
+        pad = width - len(left_status) - len(right_status)
+
+        status_bar_content = b"".join((left_status.encode('utf-8'), b" " * pad, right_status.encode('ascii')))
+        if status_bar_content != self._prev_status:
+            self._prev_status = status_bar_content
+            out += anchors[height - 1]
+            out += self._INV
+            out += status_bar_content
+            out += self._RST
 
         help_bar_content = self.status_message[:width].ljust(width)
-        output_buffer.append(f"\x1b[{height};1H{help_bar_content}")
+        if help_bar_content != self._prev_help_bar:
+            self._prev_help_bar = help_bar_content
+            out += anchors[height]
+            out += help_bar_content.encode('utf-8')
         
         draw_y = self.cursor_y - self.top_line + 1
         draw_x = visual_cursor_x - self.col_offset + 1 + self.LINE_NUM_WIDTH
-        output_buffer.append(f'\x1b[{draw_y};{draw_x}H')
-
-        output_buffer.append('\x1b[?25h')
-        
-        sys.stdout.write("".join(output_buffer))
-        sys.stdout.flush()
+        out += f'\x1b[{draw_y};{draw_x}H'.encode('ascii')
+        out += self._SHOW
+
+        self._write_frame(out)
+
+    def _write_frame(self, out):
+        fd = self._stdout_fd
+        if fd is None:
+            stream = getattr(sys.stdout, 'buffer', None)
+            if stream is None:
+                sys.stdout.write(out.decode('utf-8'))
+                sys.stdout.flush()
+            else:
+                stream.write(out)
+                stream.flush()
+            return
+        view = memoryview(out)
+        try:
+            while view:
+                try:
+                    view = view[os.write(fd, view):]
+                except BlockingIOError:
+                    select.select([], [fd], [])
+        finally:
+            view.release()
 
     def _find_next_word(self):
         x, y = self.cursor_x, self.cursor_y
-        line = str(self.buffer[y])
-        
-        while x < len(line) and not line[x].isspace():
-            x += 1
-        while x < len(line) and line[x].isspace():
-            x += 1
-            
+        line = self.buffer[y].as_str()
+        x = self._NEXT_WORD_RE.match(line, x).end()
+
         if x >= len(line):
             if y < len(self.buffer) - 1:
                 self.cursor_y += 1
@@ -895,17 +1221,16 @@ class Editor:
         
         if x == 0 and y > 0:
             self.cursor_y -= 1
-            self.cursor_x = len(str(self.buffer[self.cursor_y]))
+            self.cursor_x = self.buffer[self.cursor_y].length
             return
 
-        x -= 1
-        line = str(self.buffer[y])
-        while x > 0 and line[x-1].isspace():
-            x -= 1
-        while x > 0 and not line[x-1].isspace():
-            x -= 1
-            
-        self.cursor_x = x
+        if x <= 0:
+            self.cursor_x = 0
+            return
+
+        head = self.buffer[y].as_str()[:x - 1].rstrip()
+        words = head.rsplit(None, 1)
+        self.cursor_x = len(head) - len(words[-1]) if words else 0
 
     def copy_selection(self):
         selection = self.get_selection()
@@ -915,10 +1240,8 @@ class Editor:
         if start_y == end_y:
             self.clipboard = self.buffer[start_y].get_slice(start_x, end_x)
         else:
-            lines = []
-            lines.append(self.buffer[start_y].get_slice(start_x, None))
-            for i in range(start_y + 1, end_y):
-                lines.append(str(self.buffer[i]))
+            lines = [self.buffer[start_y].get_slice(start_x, None)]
+            lines.extend(gb.as_str() for gb in self.buffer[start_y + 1:end_y])
             lines.append(self.buffer[end_y].get_slice(0, end_x))
             self.clipboard = "\n".join(lines)
         
@@ -939,17 +1262,22 @@ class Editor:
             first_line_slice = self.buffer[start_y].get_slice(0, start_x)
             last_line_slice = self.buffer[end_y].get_slice(end_x, None)
             
-            self.buffer[start_y] = GapBuffer(first_line_slice + last_line_slice)
-            
-            del self.buffer[start_y + 1 : end_y + 1]
+            self.buffer[start_y:end_y + 1] = [GapBuffer(first_line_slice + last_line_slice)]
             self.cursor_x = start_x
         
         self.cursor_y = start_y
         self.is_dirty = True
         self.is_selecting = False
 
+    def _view_state(self):
+        return (self.cursor_x, self.cursor_y, self.is_selecting, self.selection_start_x,
+                self.selection_start_y, self.help_mode, self.is_dirty, self.status_message,
+                self.filename, self._cached_size)
+
     def handle_keypress(self, key, char):
-        self.status_message = "HELP: Ctrl-S save | Ctrl-Q quit | F1/Ctrl-H help"
+        before = self._view_state()
+        if self.status_message is not self._DEFAULT_STATUS:
+            self.status_message = self._DEFAULT_STATUS
 
         if key in self._plain_movement_keys and self.is_selecting:
             self.is_selecting = False
@@ -958,106 +1286,142 @@ class Editor:
             self.is_selecting = True
             self.selection_start_x, self.selection_start_y = self.cursor_x, self.cursor_y
 
-        action = self.action_map.get(key)
+        action = self.action_map[key]
         
-        editing_actions = {'delete_back', 'delete_forward', 'insert_newline', 'insert_char'}
-        if self.is_selecting and action in editing_actions:
+        if action in self._EDITING_ACTIONS or action in ('cut', 'paste'):
+            self._state_version += 1
+        if self.is_selecting and action in self._EDITING_ACTIONS:
             self.delete_selection()
 
-        if action == 'quit':
-            if self.is_dirty and not self.in_memory:
-                response = self.prompt("Save changes before quitting? (y/n): ")
-                if response and response.lower() == 'y':
-                    if self.save_file(): self.running = False
-                elif response and response.lower() == 'n': self.running = False
-            else:
-                self.running = False
+        handler = self._action_handlers.get(action)
+        if handler and handler(char) is self._NO_CLAMP:
             return
-        elif action == 'toggle_help':
-            self.help_mode = not self.help_mode
-        elif action == 'save': self.save_file()
-        elif action == 'copy': self.copy_selection()
-        elif action == 'cut':
-            self.copy_selection()
-            self.delete_selection()
-        elif action == 'paste':
-            if not IS_UNIX:
-                self.clipboard = get_clip_text_ps()
-            if self.is_selecting: self.delete_selection()
-            lines = self.clipboard.split('\n')
-            if len(lines) == 1:
-                self.buffer[self.cursor_y].insert(lines[0], self.cursor_x)
-                self.cursor_x += len(lines[0])
-            else:
-                current_line = self.buffer[self.cursor_y]
-                line_remainder = current_line.get_slice(self.cursor_x, None)
-                current_line.delete(self.cursor_x, len(str(current_line)) - self.cursor_x)
-                current_line.insert(lines[0], self.cursor_x)
-                
-                new_lines = [GapBuffer(line) for line in lines[1:-1]]
-                last_line = GapBuffer(lines[-1] + line_remainder)
-                
-                for i, line in enumerate(new_lines + [last_line], 1):
-                    self.buffer.insert(self.cursor_y + i, line)
-
-                self.cursor_y += len(lines) - 1
-                self.cursor_x = len(lines[-1])
-            self.is_dirty = True
         
-        elif action == 'move_up': self.cursor_y -= 1
-        elif action == 'move_down': self.cursor_y += 1
-        elif action == 'move_left':
-            if self.cursor_x > 0: self.cursor_x -= 1
-            elif self.cursor_y > 0:
-                self.cursor_y -= 1; self.cursor_x = len(str(self.buffer[self.cursor_y]))
-        elif action == 'move_right':
-            if self.cursor_x < len(str(self.buffer[self.cursor_y])): self.cursor_x += 1
-            elif self.cursor_y < len(self.buffer) - 1:
-                self.cursor_y += 1; self.cursor_x = 0
-        elif action == 'move_home': self.cursor_x = 0
-        elif action == 'move_end': self.cursor_x = len(str(self.buffer[self.cursor_y]))
-        elif action == 'move_page_up':
-            _, height = self.get_terminal_size(); self.cursor_y -= (height - 2)
-        elif action == 'move_page_down':
-            _, height = self.get_terminal_size(); self.cursor_y += (height - 2)
-        elif action == 'move_prev_word': self._find_prev_word()
-        elif action == 'move_next_word': self._find_next_word()
-        elif action == 'move_doc_start': self.cursor_y, self.cursor_x = 0, 0
-        elif action == 'move_doc_end':
-            self.cursor_y = len(self.buffer) - 1
-            self.cursor_x = len(str(self.buffer[self.cursor_y]))
-
-        elif action == 'delete_back':
-            self.is_dirty = True
-            if self.cursor_x > 0:
-                self.buffer[self.cursor_y].delete(self.cursor_x - 1, 1)
-                self.cursor_x -= 1
-            elif self.cursor_y > 0:
-                line_content = str(self.buffer.pop(self.cursor_y))
-                self.cursor_y -= 1
-                self.cursor_x = len(str(self.buffer[self.cursor_y]))
-                self.buffer[self.cursor_y].insert(line_content, self.cursor_x)
-        elif action == 'delete_forward':
-            self.is_dirty = True
-            if self.cursor_x < len(str(self.buffer[self.cursor_y])):
-                self.buffer[self.cursor_y].delete(self.cursor_x, 1)
-            elif self.cursor_y < len(self.buffer) - 1:
-                line_content = str(self.buffer.pop(self.cursor_y + 1))
-                self.buffer[self.cursor_y].insert(line_content, self.cursor_x)
-        elif action == 'insert_newline':
-            self.is_dirty = True
+        self.clamp_cursor()
+        if self._view_state() != before:
+            self._state_version += 1
+
+    def _h_quit(self, char):
+        if self.is_dirty and not self.in_memory:
+            response = self.prompt("Save changes before quitting? (y/n): ")
+            if response and response.lower() == 'y':
+                if self.save_file(): self.running = False
+            elif response and response.lower() == 'n': self.running = False
+        else:
+            self.running = False
+        self._state_version += 1
+        return self._NO_CLAMP
+
+    def _h_toggle_help(self, char):
+        self.help_mode = not self.help_mode
+
+    def _h_save(self, char):
+        self.save_file()
+
+    def _h_copy(self, char):
+        self.copy_selection()
+
+    def _h_cut(self, char):
+        self.copy_selection()
+        self.delete_selection()
+
+    def _h_paste(self, char):
+        if not IS_UNIX:
+            self.clipboard = get_clip_text_ps()
+        if self.is_selecting: self.delete_selection()
+        lines = self.clipboard.split('\n')
+        if len(lines) == 1:
+            self.buffer[self.cursor_y].insert(lines[0], self.cursor_x)
+            self.cursor_x += len(lines[0])
+        else:
             current_line = self.buffer[self.cursor_y]
             line_remainder = current_line.get_slice(self.cursor_x, None)
-            current_line.delete(self.cursor_x, len(str(current_line)) - self.cursor_x)
-            self.buffer.insert(self.cursor_y + 1, GapBuffer(line_remainder))
-            self.cursor_y += 1
-            self.cursor_x = 0
-        elif action == 'insert_char':
-            self.is_dirty = True
-            self.buffer[self.cursor_y].insert(char, self.cursor_x)
-            self.cursor_x += len(char)
-        
-        self.clamp_cursor()
+            current_line.delete(self.cursor_x, current_line.length - self.cursor_x)
+            current_line.insert(lines[0], self.cursor_x)
+            
+            new_lines = [GapBuffer(line) for line in lines[1:-1]]
+            last_line = GapBuffer(lines[-1] + line_remainder)
+            
+            new_lines.append(last_line)
+            self.buffer[self.cursor_y + 1:self.cursor_y + 1] = new_lines
+
+            self.cursor_y += len(lines) - 1
+            self.cursor_x = len(lines[-1])
+        self.is_dirty = True
+
+    def _h_move_up(self, char):
+        self.cursor_y -= 1
+
+    def _h_move_down(self, char):
+        self.cursor_y += 1
+
+    def _h_move_left(self, char):
+        if self.cursor_x > 0: self.cursor_x -= 1
+        elif self.cursor_y > 0:
+            self.cursor_y -= 1; self.cursor_x = self.buffer[self.cursor_y].length
+
+    def _h_move_right(self, char):
+        if self.cursor_x < self.buffer[self.cursor_y].length: self.cursor_x += 1
+        elif self.cursor_y < len(self.buffer) - 1:
+            self.cursor_y += 1; self.cursor_x = 0
+
+    def _h_move_home(self, char):
+        self.cursor_x = 0
+
+    def _h_move_end(self, char):
+        self.cursor_x = self.buffer[self.cursor_y].length
+
+    def _h_move_page_up(self, char):
+        _, height = self.get_terminal_size(); self.cursor_y -= (height - 2)
+
+    def _h_move_page_down(self, char):
+        _, height = self.get_terminal_size(); self.cursor_y += (height - 2)
+
+    def _h_move_prev_word(self, char):
+        self._find_prev_word()
+
+    def _h_move_next_word(self, char):
+        self._find_next_word()
+
+    def _h_move_doc_start(self, char):
+        self.cursor_y, self.cursor_x = 0, 0
+
+    def _h_move_doc_end(self, char):
+        self.cursor_y = len(self.buffer) - 1
+        self.cursor_x = self.buffer[self.cursor_y].length
+
+    def _h_delete_back(self, char):
+        self.is_dirty = True
+        if self.cursor_x > 0:
+            self.buffer[self.cursor_y].delete(self.cursor_x - 1, 1)
+            self.cursor_x -= 1
+        elif self.cursor_y > 0:
+            line_content = self.buffer.pop(self.cursor_y).as_str()
+            self.cursor_y -= 1
+            self.cursor_x = self.buffer[self.cursor_y].length
+            self.buffer[self.cursor_y].insert(line_content, self.cursor_x)
+
+    def _h_delete_forward(self, char):
+        self.is_dirty = True
+        if self.cursor_x < self.buffer[self.cursor_y].length:
+            self.buffer[self.cursor_y].delete(self.cursor_x, 1)
+        elif self.cursor_y < len(self.buffer) - 1:
+            line_content = self.buffer.pop(self.cursor_y + 1).as_str()
+            self.buffer[self.cursor_y].insert(line_content, self.cursor_x)
+
+    def _h_insert_newline(self, char):
+        self.is_dirty = True
+        current_line = self.buffer[self.cursor_y]
+        line_remainder = current_line.get_slice(self.cursor_x, None)
+        current_line.delete(self.cursor_x, current_line.length - self.cursor_x)
+        self.buffer.insert(self.cursor_y + 1, GapBuffer(line_remainder))
+        self.cursor_y += 1
+        self.cursor_x = 0
+
+    def _h_insert_char(self, char):
+        self.is_dirty = True
+        self.buffer[self.cursor_y].insert(char, self.cursor_x)
+        self.cursor_x += len(char)
 
     def save_file(self):
         if self.in_memory:
@@ -1079,8 +1443,13 @@ class Editor:
                 return False
         
         try:
-            with open(self.filename, 'w', encoding="utf-8") as f:
-                f.write('\n'.join(str(gb) for gb in self.buffer))
+            with open(self.filename, 'w', encoding="utf-8", buffering=1 << 20) as f:
+                write = f.write
+                last = len(self.buffer) - 1
+                for i, gb in enumerate(self.buffer):
+                    write(gb.as_str())
+                    if i != last:
+                        write('\n')
             self.is_dirty = False
             self.status_message = f'Saved {len(self.buffer)} lines to "{self.filename}".'
             return True
@@ -1092,26 +1461,52 @@ class Editor:
         if IS_UNIX:
             fd = sys.stdin.fileno()
             old_settings = termios.tcgetattr(fd)
+            try:
+                sys.stdout.flush()
+                self._stdout_fd = sys.stdout.fileno()
+            except (AttributeError, OSError, ValueError):
+                self._stdout_fd = None
+        old_winch = None
+        if hasattr(signal, 'SIGWINCH'):
+            try:
+                old_winch = signal.signal(signal.SIGWINCH, self._on_resize)
+                self._has_winch = True
+            except ValueError:
+                pass
         try:
             if IS_UNIX:
                 tty.setraw(sys.stdin.fileno())
+            self._invalidate_screen()
             self.render()
             while self.running:
                 try:
                     key, char = self.key_decoder.get_key()
+                    deadline = time.monotonic() + self.COALESCE_SECONDS
                     self.handle_keypress(key, char)
-                    if self.running:
+                    budget = self.COALESCE_KEYS - 1
+                    while (self.running and budget and self.key_decoder.has_pending()
+                           and time.monotonic() < deadline):
+                        key, char = self.key_decoder.get_key()
+                        self.handle_keypress(key, char)
+                        budget -= 1
+                    if not self._has_winch:
+                        self._poll_terminal_size()
+                    if self.running and self._state_version != self._last_rendered_version:
                         self.render()
                 except KeyboardInterrupt:
                     pass
         finally:
+            self._stdout_fd = None
+            if self._has_winch:
+                signal.signal(signal.SIGWINCH, old_winch if old_winch is not None else signal.SIG_DFL)
+                self._has_winch = False
             if IS_UNIX:
                 termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
             sys.stdout.write('\x1b[2J\x1b[H')
             sys.stdout.flush()
         
         if self.in_memory:
-            return '\n'.join(str(gb) for gb in self.buffer)
+            return '\n'.join(gb.as_str() for gb in self.buffer)
 
 if __name__ == "__main__":
     import argparse